@@ -6,8 +6,8 @@ Analyzes existing datasets.csv files to generate schema definitions.
 Identifies duplicate columns (.1, .2 suffixes) and traces them back to likely sources.
 """
 
+import numpy as np
 import pandas as pd
-import re
 from pathlib import Path
 from collections import defaultdict
 
@@ -29,11 +29,12 @@ def analyze_csv(csv_path):
     duplicate_groups = find_duplicate_groups(columns)
 
     if duplicate_groups:
+        non_null_counts = df.notna().sum()  # One vectorized pass over every column
         print(f"\nDuplicate column groups found: {len(duplicate_groups)}")
         for base, variants in sorted(duplicate_groups.items()):
             print(f"\n  {base}:")
             for col in variants:
-                non_null = df[col].notna().sum()
+                non_null = non_null_counts[col]
                 print(f"    - {col:60s} ({non_null} non-null values)")
 
     print(f"\n{'-'*80}")
@@ -42,7 +43,7 @@ def analyze_csv(csv_path):
 
     type_counts = defaultdict(list)
     for col in columns:
-        dtype = infer_type(df[col])
+        dtype = infer_type(df[col].to_numpy())
         type_counts[dtype].append(col)
 
     for dtype, cols in sorted(type_counts.items()):
@@ -55,43 +56,44 @@ def analyze_csv(csv_path):
     return columns, duplicate_groups, df
 
 
+def split_suffix(col):
+    """Split a column name into its base and numeric .N suffix (None if absent)."""
+    base, _, suffix = col.rpartition('.')
+    if base and suffix.isdecimal():
+        return base, suffix
+    return col, None
+
+
 def find_duplicate_groups(columns):
     """Find groups of columns that are duplicates (base + .1, .2, etc.)."""
     duplicate_groups = defaultdict(list)
 
     for col in columns:
-        match = re.match(r'^(.+?)(?:\.(\d+))?$', col)
-        if match:
-            base, suffix = match.groups()
-            if suffix:  # Has .N suffix
-                duplicate_groups[base].append(col)
+        base, suffix = split_suffix(col)
+        if suffix:  # Has .N suffix
+            duplicate_groups[base].append(col)
 
     result = {}
     for base, suffixed in duplicate_groups.items():
         if base in columns:
-            result[base] = [base] + sorted(suffixed, key=lambda x: int(x.split('.')[-1]))
+            result[base] = [base] + sorted(suffixed, key=lambda x: int(x.rsplit('.', 1)[1]))
         else:
-            result[base] = sorted(suffixed, key=lambda x: int(x.split('.')[-1]))
+            result[base] = sorted(suffixed, key=lambda x: int(x.rsplit('.', 1)[1]))
 
     return result
 
 
-def infer_type(series):
-    """Infer the most appropriate type for a column."""
-    if series.isna().all():
+def infer_type(arr):
+    """Infer the most appropriate type for a column's NumPy values."""
+    if arr.size == 0 or pd.isna(arr).all():
         return 'object'
 
-    non_null = series.dropna()
-
-    if len(non_null) == 0:
-        return 'object'
+    if np.issubdtype(arr.dtype, np.bool_):
+        return 'bool'
 
-    if pd.api.types.is_numeric_dtype(series):
+    if np.issubdtype(arr.dtype, np.number):
         return 'numeric'
 
-    if pd.api.types.is_bool_dtype(series):
-        return 'bool'
-
     return 'object'
 
 
@@ -106,11 +108,11 @@ def generate_schema_dict(columns, df, duplicate_groups):
         if col in processed:
             continue
 
-        dtype = infer_type(df[col])
+        dtype = infer_type(df[col].to_numpy())
         py_type = 'str' if dtype == 'object' else dtype
 
-        base_match = re.match(r'^(.+?)\.(\d+)$', col)
-        if base_match and base_match.group(1) in duplicate_groups:
+        base, suffix = split_suffix(col)
+        if suffix and base in duplicate_groups:
             continue
 
         lines.append(f"    '{col}': '{py_type}',")
@@ -127,6 +129,8 @@ def suggest_consolidation_rules(duplicate_groups, df):
     print("CONSOLIDATION SUGGESTIONS")
     print(f"{'='*80}")
 
+    non_null_counts = df.notna().sum()
+
     for base, variants in sorted(duplicate_groups.items()):
         print(f"\n{base}:")
 
@@ -157,7 +161,7 @@ def suggest_consolidation_rules(duplicate_groups, df):
         else:
             print(f"  Suggestion: Manual review needed")
             for var in variants:
-                non_null = df[var].notna().sum()
+                non_null = non_null_counts[var]
                 print(f"    {var} ({non_null} values)")
 
 
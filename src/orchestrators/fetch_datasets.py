@@ -1,12 +1,48 @@
 import os
 import pandas as pd
 import tqdm
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
 from sources import unhcr, worldbank
 from utils import UNHCR_DATA_PATH, WB_DATA_PATH
 from schemas.column_mappings import apply_prefix_mapping, enforce_schema, get_schema_for_source
 
 MAX_WORKERS = 20
+MAX_IN_FLIGHT = MAX_WORKERS * 2
+BATCH_SIZE = 256
+
+def fetch_record(fetch_function, id):
+    """
+    Fetch a single record, tagging it with its ID and isolating failures.
+
+    Parameters:
+    - fetch_function (callable): Function to fetch data for a single ID.
+    - id: Dataset ID from the metadata list.
+
+    Returns:
+    - dict or None: The fetched record, or None if the request failed.
+    """
+    try:
+        data = fetch_function(id)
+    except Exception as e:
+        print(f"An error occurred for ID {id}: {e}")
+        return None
+    # Attach the ID from metadata to ensure downstream processing has a key.
+    if isinstance(data, dict) and "id" not in data:
+        data["id"] = id
+    return data
+
+def normalize_batch(records):
+    """
+    Flatten a batch of fetched records into a DataFrame.
+
+    Parameters:
+    - records (list): Raw JSON dicts returned by the fetch function.
+
+    Returns:
+    - pd.DataFrame: Flattened records.
+    """
+    return pd.json_normalize(records)
 
 def process_meta(input_file, output_file, fetch_function, source_name):
     """
@@ -38,22 +74,36 @@ def process_meta(input_file, output_file, fetch_function, source_name):
 
     print(f"Fetching {len(new_ids)} new datasets out of {len(df_meta)} total")
 
-    records = []
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {executor.submit(fetch_function, id): id for id in new_ids}
-
-        for future in tqdm.tqdm(as_completed(futures), total=len(futures), disable=True):
-            try:
+    frames = []
+    batch = []
+    pending_ids = iter(new_ids)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor, \
+            tqdm.tqdm(total=len(new_ids), disable=True) as progress:
+        # Keep a bounded window of requests in flight instead of submitting every ID up front.
+        futures = {executor.submit(fetch_record, fetch_function, id) for id in islice(pending_ids, MAX_IN_FLIGHT)}
+
+        while futures:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
                 data = future.result()
-                # Attach the ID from metadata to ensure downstream processing has a key.
-                if isinstance(data, dict) and "id" not in data:
-                    data["id"] = futures[future]
-                records.append(data)
-            except Exception as e:
-                print(f"An error occurred for ID {futures[future]}: {e}")
+                if data is not None:
+                    batch.append(data)
+                progress.update()
+
+                if len(batch) >= BATCH_SIZE:
+                    frames.append(normalize_batch(batch))
+                    batch = []
+
+            for id in islice(pending_ids, len(done)):
+                futures.add(executor.submit(fetch_record, fetch_function, id))
+
+    if batch:
+        frames.append(normalize_batch(batch))
 
-    new_df = pd.json_normalize(records)
+    new_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
+    # Map prefixes and enforce the schema once on the combined frame, so the
+    # result does not depend on how records were split into batches.
     schema = get_schema_for_source(source_name)
     new_df = apply_prefix_mapping(new_df)
     new_df = enforce_schema(new_df, schema)
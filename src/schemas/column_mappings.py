@@ -9,6 +9,9 @@ This module provides:
 
 import pandas as pd
 import logging
+import re
+from collections import Counter
+from functools import lru_cache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -22,6 +25,9 @@ PREFIX_MAPPINGS = {
     'data_collection.': 'method.',
 }
 
+# Single anchored pattern matching any mapped prefix at the start of a column name.
+PREFIX_PATTERN = re.compile('^(?:' + '|'.join(map(re.escape, PREFIX_MAPPINGS)) + ')')
+
 
 WORLD_BANK_SCHEMA = {
     'id': 'Int64',
@@ -224,19 +230,14 @@ def apply_prefix_mapping(df):
     Returns:
         DataFrame with renamed columns
     """
-    new_columns = {}
-
-    for col in df.columns:
-        new_col = col
-        for old_prefix, new_prefix in PREFIX_MAPPINGS.items():
-            if new_col.startswith(old_prefix):
-                new_col = new_col.replace(old_prefix, new_prefix, 1)
-                break
-        new_columns[col] = new_col
+    new_columns = [
+        PREFIX_PATTERN.sub(lambda m: PREFIX_MAPPINGS[m.group(0)], col, count=1)
+        for col in df.columns.tolist()
+    ]
 
-    df = df.rename(columns=new_columns)
+    df = df.set_axis(new_columns, axis=1)
 
-    duplicates = set([col for col in df.columns if df.columns.tolist().count(col) > 1])
+    duplicates = {col for col, count in Counter(new_columns).items() if count > 1}
     if duplicates:
         logger.warning(f"Duplicate columns detected after prefix mapping: {duplicates}")
 
@@ -259,23 +260,28 @@ def enforce_schema(df, schema):
     Returns:
         DataFrame aligned to schema
     """
-    extra_cols = set(df.columns) - set(schema.keys())
+    expected_cols = frozenset(schema)
+    present_cols = frozenset(df.columns)
+
+    extra_cols = present_cols - expected_cols
     if extra_cols:
         logger.info(f"Dropping {len(extra_cols)} extra columns not in schema")
         logger.debug(f"Extra columns: {sorted(extra_cols)}")
         df = df.drop(columns=list(extra_cols))
 
-    missing_cols = set(schema.keys()) - set(df.columns)
+    missing_cols = expected_cols - present_cols
     if missing_cols:
         logger.info(f"Adding {len(missing_cols)} missing columns from schema")
-        for col in missing_cols:
-            df[col] = pd.NA
+        # Add all missing columns in one block rather than inserting them one at a time.
+        missing_df = pd.DataFrame(pd.NA, index=df.index, columns=sorted(missing_cols))
+        df = pd.concat([df, missing_df], axis=1)
 
     df = df[list(schema.keys())]
 
     return df
 
 
+@lru_cache(maxsize=None)
 def get_schema_for_source(source_name):
     """
     Get the schema for a given data source.
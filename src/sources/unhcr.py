@@ -1,9 +1,10 @@
 import requests
 import pandas as pd
 import logging
-from utils import UNHCR_DATA_PATH
+from utils import UNHCR_DATA_PATH, get_session
 
-METADATA_LIST_URL = "https://microdata.unhcr.org/index.php/api/catalog/search?ps=9999999&sort_by=created&sort_order=desc"
+METADATA_LIST_URL = "https://microdata.unhcr.org/index.php/api/catalog/search?ps={}&page={}&sort_by=created&sort_order=desc"
+METADATA_PAGE_SIZE = 500
 DATASET_EXPORT_URL = "https://microdata.unhcr.org/index.php/metadata/export/{}/json"
 
 HEADERS = {
@@ -16,15 +17,33 @@ def fetch_metadata_list():
     """
     Fetch metadata list from UNHCR API.
 
+    The catalog is requested in pages of METADATA_PAGE_SIZE rows so that only
+    one page of parsed JSON is held in memory at a time.
+
     Returns:
     - pd.DataFrame: The metadata as a pandas DataFrame.
     """
     try:
-        response = requests.get(METADATA_LIST_URL, headers=HEADERS)
-        response.raise_for_status()
-        data = response.json()
-        data = data["result"]["rows"]
-        return pd.DataFrame(data)
+        frames = []
+        fetched = 0
+        page = 1
+        while True:
+            response = get_session().get(METADATA_LIST_URL.format(METADATA_PAGE_SIZE, page), headers=HEADERS)
+            response.raise_for_status()
+            result = response.json()["result"]
+            rows = result["rows"]
+            if rows:
+                frames.append(pd.DataFrame(rows))
+            fetched += len(rows)
+            found = int(result.get("found") or 0)
+            if len(rows) < METADATA_PAGE_SIZE or (found and fetched >= found):
+                break
+            page += 1
+
+        if not frames:
+            return pd.DataFrame()
+        # Rows can shift between pages if a dataset is published mid-run.
+        return pd.concat(frames, ignore_index=True).drop_duplicates(subset="id")
     except requests.RequestException as e:
         logging.error(f"UNHCR Request failed: {e}")
         raise
@@ -42,7 +61,7 @@ def fetch_dataset(id):
     Returns:
     - dict: Dataset information
     """
-    response = requests.get(DATASET_EXPORT_URL.format(id), headers=HEADERS)
+    response = get_session().get(DATASET_EXPORT_URL.format(id), headers=HEADERS)
     response.raise_for_status()
     data = response.json()
     data["id"] = id
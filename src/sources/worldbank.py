@@ -1,7 +1,7 @@
 import requests
 import pandas as pd
 import logging
-from utils import WB_DATA_PATH
+from utils import WB_DATA_PATH, get_session
 
 METADATA_LIST_URL = "https://microdata.worldbank.org/index.php/api/catalog/list_idno/survey"
 DATASET_EXPORT_URL = "https://microdata.worldbank.org/index.php/metadata/export/{}"
@@ -38,6 +38,6 @@ def fetch_dataset(id):
     Returns:
     - dict: Dataset information
     """
-    response = requests.get(DATASET_EXPORT_URL.format(id))
+    response = get_session().get(DATASET_EXPORT_URL.format(id))
     response.raise_for_status()
     return response.json()
@@ -1,5 +1,7 @@
 import pandas as pd
+import requests
 import ast
+import threading
 from typing import List
 import os
 
@@ -8,6 +10,25 @@ PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
 UNHCR_DATA_PATH = os.path.join(PROJECT_ROOT, "data", "unhcr") + "/"
 WB_DATA_PATH = os.path.join(PROJECT_ROOT, "data", "world_bank") + "/"
 
+_thread_local = threading.local()
+
+
+def get_session() -> requests.Session:
+    """
+    Returns a requests Session bound to the calling thread.
+
+    Reusing one session per worker thread keeps connections alive between
+    requests, so each call does not pay for a new TCP and TLS handshake.
+
+    Returns:
+    requests.Session: The session for the current thread.
+    """
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
 
 def find_list_columns(df: pd.DataFrame) -> List[str]:
     """
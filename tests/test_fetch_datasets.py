@@ -0,0 +1,83 @@
+"""
+Tests for batched dataset fetching in process_meta.
+"""
+
+import pandas as pd
+import sys
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from orchestrators import fetch_datasets
+from schemas.column_mappings import get_schema_for_source
+
+
+FAILING_ID = 13
+
+
+def fake_fetch(id):
+    """Return a nested record shaped like an API export, failing for one ID."""
+    if id == FAILING_ID:
+        raise RuntimeError("request failed")
+    record = {
+        'title': f'Dataset {id}',
+        'study_desc': {'version_statement': {'version': str(id)}},
+        'method': {'notes': f'method {id}'},
+        'unused_field': 'dropped',
+    }
+    # Only some records carry data_collection fields, so batches differ in shape.
+    if id % 5 == 0:
+        record['data_collection'] = {'coll_mode': f'mode {id}'}
+    return record
+
+
+def test_process_meta_batches(tmp_path):
+    """Test that batched fetching keeps every successful ID exactly once."""
+    print("Testing process_meta batching...")
+
+    ids = list(range(1, fetch_datasets.MAX_IN_FLIGHT * 2 + 11))
+    input_file = tmp_path / 'metadata.csv'
+    output_file = tmp_path / 'datasets.csv'
+    pd.DataFrame({'id': ids}).to_csv(input_file, index=False)
+
+    with mock.patch.object(fetch_datasets, 'BATCH_SIZE', 7):
+        result = fetch_datasets.process_meta(str(input_file), str(output_file), fake_fetch, 'worldbank')
+
+    expected_ids = [id for id in ids if id != FAILING_ID]
+
+    assert result['id'].tolist() == expected_ids, "Each successful ID should appear exactly once"
+    assert list(result.columns) == list(get_schema_for_source('worldbank')), "Columns should match the schema"
+    assert result.loc[result['id'] == 10, 'method.coll_mode'].item() == 'mode 10'
+    assert result.loc[result['id'] == 1, 'method.coll_mode'].isna().all()
+
+    print("✓ process_meta batching test passed")
+
+
+def test_process_meta_duplicate_prefixes_across_batches(tmp_path):
+    """Test that method./data_collection. collisions in one batch don't break concat."""
+    print("Testing process_meta with colliding prefixes across batches...")
+
+    records = {
+        1: {'method': {'notes': 'a'}, 'data_collection': {'notes': 'b'}},
+        2: {'method': {'notes': 'c'}},
+    }
+    input_file = tmp_path / 'metadata.csv'
+    output_file = tmp_path / 'datasets.csv'
+    pd.DataFrame({'id': list(records)}).to_csv(input_file, index=False)
+
+    with mock.patch.object(fetch_datasets, 'BATCH_SIZE', 1):
+        result = fetch_datasets.process_meta(str(input_file), str(output_file), records.get, 'worldbank')
+
+    assert result['id'].tolist() == [1, 2]
+
+    print("✓ Colliding prefixes test passed")
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        test_process_meta_batches(Path(tmp_dir))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        test_process_meta_duplicate_prefixes_across_batches(Path(tmp_dir))
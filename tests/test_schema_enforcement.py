@@ -42,6 +42,22 @@ def test_prefix_mapping():
     print("✓ Prefix mapping test passed")
 
 
+def test_prefix_mapping_only_leading():
+    """Test that prefixes are only mapped at the start of a column name."""
+    print("Testing prefix mapping only applies to leading prefixes...")
+
+    df = pd.DataFrame({
+        'analysis_info.method.notes': ['a'],
+        'sources.study_desc.title': ['b'],
+    })
+
+    result = apply_prefix_mapping(df)
+
+    assert list(result.columns) == list(df.columns), f"Non-leading prefixes were rewritten: {list(result.columns)}"
+
+    print("✓ Leading prefix test passed")
+
+
 def test_schema_enforcement():
     """Test that schema enforcement adds missing columns and drops extras."""
     print("Testing schema enforcement...")
@@ -129,6 +145,7 @@ def run_all_tests():
 
     try:
         test_prefix_mapping()
+        test_prefix_mapping_only_leading()
         test_schema_enforcement()
         test_no_schema_drift_on_concat()
         test_get_schema_for_source()